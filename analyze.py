@@ -1,12 +1,15 @@
 """
 Flask backend for Resume Analyzer API with file extension preservation
 """
-from flask import Flask, request, jsonify
+from flask import Flask, request
 from flask_cors import CORS
+import io
+import orjson
 import os
-import tempfile
+import hashlib
+import threading
+from collections import OrderedDict
 from os import environ
-from werkzeug.utils import secure_filename
 
 from resume_parser import parse_document
 from skill_matcher import SkillMatcher
@@ -14,60 +17,119 @@ from skill_matcher import SkillMatcher
 app = Flask(__name__)
 CORS(app)
 
+def ojsonify(obj):
+    """
+    Serialize obj to a JSON response using orjson
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Response: Flask response with application/json mimetype
+    """
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
+
 skill_matcher = SkillMatcher()
 
+# Parsed text of recent uploads, keyed by content hash and extension.
+# Bounded both by entry count and by total cached characters, and documents
+# longer than PARSE_CACHE_MAX_TEXT_CHARS are never cached, so large uploads
+# cannot pin memory and only a limited amount of resume text (personal data)
+# outlives its request.
+PARSE_CACHE_SIZE = 128
+PARSE_CACHE_MAX_CHARS = 2_000_000
+PARSE_CACHE_MAX_TEXT_CHARS = 100_000
+PARSE_CACHE = OrderedDict()
+_parse_cache_chars = 0
+_PARSE_CACHE_LOCK = threading.Lock()
+
+def parse_upload(filename, blob):
+    """
+    Parse an uploaded file, reusing the text of previously seen content
+
+    Args:
+        filename (str): Original name of the uploaded file
+        blob (bytes): Contents of the uploaded file
+
+    Returns:
+        str: Extracted text from the document or empty string if parsing fails
+    """
+    # Preserve file extensions
+    file_ext = os.path.splitext(filename)[1]
+
+    key = (hashlib.blake2b(blob, digest_size=16).digest(), file_ext.lower())
+    with _PARSE_CACHE_LOCK:
+        if key in PARSE_CACHE:
+            PARSE_CACHE.move_to_end(key)
+            return PARSE_CACHE[key]
+
+    print("Parsing document:", filename)
+    text = parse_document(io.BytesIO(blob), file_ext)
+
+    # Only cache successful parses of reasonably sized documents
+    if text and len(text) <= PARSE_CACHE_MAX_TEXT_CHARS:
+        _cache_text(key, text)
+
+    return text
+
+def _cache_text(key, text):
+    """
+    Store parsed text in PARSE_CACHE, evicting the oldest entries to stay
+    within the entry and character limits
+
+    Args:
+        key (tuple): Content hash and file extension
+        text (str): Parsed text of the document
+    """
+    global _parse_cache_chars
+
+    with _PARSE_CACHE_LOCK:
+        if key in PARSE_CACHE:
+            return
+        PARSE_CACHE[key] = text
+        _parse_cache_chars += len(text)
+        while len(PARSE_CACHE) > PARSE_CACHE_SIZE or _parse_cache_chars > PARSE_CACHE_MAX_CHARS:
+            _, evicted = PARSE_CACHE.popitem(last=False)
+            _parse_cache_chars -= len(evicted)
+
 @app.route('/analyze', methods=['POST'])
 def analyze():
     if 'resume' not in request.files or 'job_description' not in request.files:
-        return jsonify({'error': 'Both resume and job description files are required'}), 400
+        return ojsonify({'error': 'Both resume and job description files are required'}), 400
 
     resume_file = request.files['resume']
     job_desc_file = request.files['job_description']
 
     if resume_file.filename == '' or job_desc_file.filename == '':
-        return jsonify({'error': 'No selected file'}), 400
-
-    # Preserve file extensions
-    resume_ext = os.path.splitext(resume_file.filename)[1]
-    job_desc_ext = os.path.splitext(job_desc_file.filename)[1]
-
-    with tempfile.NamedTemporaryFile(delete=False, suffix=resume_ext) as temp_resume:
-        resume_path = temp_resume.name
-        resume_file.save(resume_path)
-
-    with tempfile.NamedTemporaryFile(delete=False, suffix=job_desc_ext) as temp_job:
-        job_desc_path = temp_job.name
-        job_desc_file.save(job_desc_path)
+        return ojsonify({'error': 'No selected file'}), 400
 
     try:
-        print("Parsing resume from:", resume_path)
-        resume_text = parse_document(resume_path)
-        print("Resume text preview:", resume_text[:500])
+        # Documents are parsed one after the other: PDFium calls are serialized
+        # by the parser's lock and TXT parsing is cheaper than starting a
+        # thread, so a worker thread per request would only add thread churn
+        resume_text = parse_upload(resume_file.filename, resume_file.stream.read())
+        job_desc_text = parse_upload(job_desc_file.filename, job_desc_file.stream.read())
 
-        print("Parsing job description from:", job_desc_path)
-        job_desc_text = parse_document(job_desc_path)
+        print("Resume text preview:", resume_text[:500])
         print("Job description text preview:", job_desc_text[:500])
 
         if not resume_text or not job_desc_text:
-            return jsonify({'error': 'Failed to parse one or both documents'}), 400
+            return ojsonify({'error': 'Failed to parse one or both documents'}), 400
 
-        results = skill_matcher.analyze(resume_text, job_desc_text)
+        # Whitespace-only documents have nothing to analyze
+        if not resume_text.strip() or not job_desc_text.strip():
+            return ojsonify(skill_matcher.empty_result())
 
-        os.unlink(resume_path)
-        os.unlink(job_desc_path)
+        results = skill_matcher.analyze(resume_text, job_desc_text)
 
-        return jsonify(results)
+        return ojsonify(results)
 
     except Exception as e:
-        if os.path.exists(resume_path):
-            os.unlink(resume_path)
-        if os.path.exists(job_desc_path):
-            os.unlink(job_desc_path)
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({'status': 'ok'})
+    return ojsonify({'status': 'ok'})
 
 if __name__ == '__main__':
     app.run(host="0.0.0.0", port=int(environ.get("PORT", 5000)))
\ No newline at end of file
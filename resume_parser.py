@@ -2,9 +2,10 @@
 Resume Parser Module
 Handles parsing of different file formats (PDF, DOCX, TXT)
 """
-import os
-import io
+import threading
+import pypdfium2 as pdfium
 from pdfminer.high_level import extract_text as pdf_extract
+from pdfminer.layout import LAParams
 from pdfminer.pdfparser import PDFSyntaxError
 import docx
 import logging
@@ -13,28 +14,34 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def parse_document(file_path):
+# PDFium is not thread-safe, so calls into it must be serialized
+_PDFIUM_LOCK = threading.Lock()
+
+# Layout parameters for the pdfminer fallback, created once and reused
+_LAPARAMS = LAParams()
+
+def parse_document(stream, file_extension):
     """
     Parse document based on file extension
     
     Args:
-        file_path (str): Path to the document file
+        stream (file-like): Binary stream with the document contents
+        file_extension (str): Extension of the original file name
         
     Returns:
         str: Extracted text from the document or empty string if parsing fails
     """
     try:
-        # Get file extension (lowercase)
-        _, file_extension = os.path.splitext(file_path)
+        # Normalize file extension (lowercase)
         file_extension = file_extension.lower()
         
         # Parse based on file extension
         if file_extension == '.pdf':
-            return parse_pdf(file_path)
+            return parse_pdf(stream)
         elif file_extension == '.docx':
-            return parse_docx(file_path)
+            return parse_docx(stream)
         elif file_extension == '.txt':
-            return parse_txt(file_path)
+            return parse_txt(stream)
         else:
             logger.error(f"Unsupported file format: {file_extension}")
             return ""
@@ -42,35 +49,47 @@ def parse_document(file_path):
         logger.error(f"Error parsing document: {str(e)}")
         return ""
 
-def parse_pdf(file_path):
+def parse_pdf(stream):
     """
     Extract text from PDF files
     
     Args:
-        file_path (str): Path to the PDF file
+        stream (file-like): Binary stream with the PDF contents
         
     Returns:
         str: Extracted text from the PDF
     """
     try:
-        text = pdf_extract(file_path)
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(stream)
+            try:
+                return '\n'.join(page.get_textpage().get_text_range() for page in pdf)
+            finally:
+                pdf.close()
+    except pdfium.PdfiumError as e:
+        # Fall back to pdfminer, which copes with some malformed PDFs
+        logger.warning(f"Error parsing PDF with pdfium, retrying with pdfminer: {str(e)}")
+        stream.seek(0)
+
+    try:
+        text = pdf_extract(stream, laparams=_LAPARAMS)
         return text
     except PDFSyntaxError as e:
         logger.error(f"Error parsing PDF: {str(e)}")
         return ""
 
-def parse_docx(file_path):
+def parse_docx(stream):
     """
     Extract text from DOCX files
     
     Args:
-        file_path (str): Path to the DOCX file
+        stream (file-like): Binary stream with the DOCX contents
         
     Returns:
         str: Extracted text from the DOCX
     """
     try:
-        doc = docx.Document(file_path)
+        doc = docx.Document(stream)
         full_text = []
         for para in doc.paragraphs:
             full_text.append(para.text)
@@ -79,27 +98,23 @@ def parse_docx(file_path):
         logger.error(f"Error parsing DOCX: {str(e)}")
         return ""
 
-def parse_txt(file_path):
+def parse_txt(stream):
     """
     Extract text from TXT files
     
     Args:
-        file_path (str): Path to the TXT file
+        stream (file-like): Binary stream with the TXT contents
         
     Returns:
         str: Content of the TXT file
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return file.read()
-    except UnicodeDecodeError:
-        # Try different encoding if utf-8 fails
+        blob = stream.read()
         try:
-            with open(file_path, 'r', encoding='latin-1') as file:
-                return file.read()
-        except Exception as e:
-            logger.error(f"Error parsing TXT with alternate encoding: {str(e)}")
-            return ""
+            return blob.decode('utf-8')
+        except UnicodeDecodeError:
+            # Try different encoding if utf-8 fails
+            return blob.decode('latin-1')
     except Exception as e:
         logger.error(f"Error parsing TXT: {str(e)}")
         return ""
\ No newline at end of file
@@ -3,78 +3,120 @@ Skill Matcher Module (Simplified Version)
 Uses basic NLP techniques to extract skills from resumes and job descriptions
 and compare them using text similarity
 """
+import os
 import re
-import logging
+import json
+import math
+import itertools
+import ahocorasick
 from collections import Counter
-import numpy as np
-from sklearn.feature_extraction.text import CountVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Skill vocabulary grouped by category, loaded once at import
+SKILLS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills.json')
+with open(SKILLS_PATH, encoding='utf-8') as skills_file:
+    SKILL_CATEGORIES = json.load(skills_file)
 
-class SkillMatcher:
-    def __init__(self):
-        """
-        Initialize the SkillMatcher with skill detection capabilities
-        """
-        # Common technical skills to detect
-        self.common_tech_skills = {
-            "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "php", "swift",
-            "kotlin", "Golang", "Go", "rust", "html", "css", "react", "angular", "vue", "node.js", "express",
-            "django", "flask", "spring", "hibernate", "docker", "kubernetes", "aws", "azure", 
-            "gcp", "terraform", "jenkins", "github actions", "circleci", "travis", "git", "svn",
-            "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "kafka", "rabbitmq",
-            "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy", "matplotlib", "tableau",
-            "power bi", "excel", "jira", "confluence", "agile", "scrum", "kanban", "rest api",
-            "graphql", "oauth", "jwt", "microservices", "devops", "ci/cd", "machine learning",
-            "deep learning", "nlp", "data analysis", "data science", "big data", "hadoop", "spark"
-        }
+# Flattened set of all skills
+ALL_SKILLS = frozenset(itertools.chain.from_iterable(SKILL_CATEGORIES.values()))
+
+def _build_automaton(skills):
+    """
+    Build an Aho-Corasick automaton so every skill is matched in one pass
+    
+    Args:
+        skills (iterable): The skills to match
         
-        # Additional skill categories and terms
-        self.skill_categories = {
-            "programming_languages": {
-                "python", "java", "c++", "c#", "javascript", "typescript", "ruby", "go", "rust", 
-                "php", "scala", "kotlin", "swift", "r", "perl", "bash", "powershell", "sql"
-            },
-            "frontend": {
-                "html", "css", "javascript", "react", "angular", "vue", "redux", "bootstrap", 
-                "tailwind", "jquery", "webpack", "sass", "less", "typescript", "next.js", "gatsby"
-            },
-            "backend": {
-                "node.js", "express", "django", "flask", "spring", "laravel", "ruby on rails", 
-                "asp.net", "fastapi", "graphql", "rest api", "websockets", "microservices"
-            },
-            "databases": {
-                "sql", "mysql", "postgresql", "mongodb", "sqlite", "oracle", "dynamodb", "redis", 
-                "cassandra", "elasticsearch", "firebase", "mariadb", "neo4j", "couchbase"
-            },
-            "devops": {
-                "docker", "kubernetes", "jenkins", "gitlab ci", "github actions", "terraform", 
-                "ansible", "puppet", "chef", "aws", "azure", "gcp", "ci/cd", "prometheus", "grafana"
-            },
-            "data_science": {
-                "python", "r", "pandas", "numpy", "matplotlib", "scikit-learn", "tensorflow", 
-                "pytorch", "keras", "jupyter", "tableau", "power bi", "machine learning", 
-                "deep learning", "statistics", "data visualization", "big data", "data mining"
-            },
-            "soft_skills": {
-                "leadership", "communication", "teamwork", "problem solving", "critical thinking", 
-                "time management", "project management", "creativity", "adaptability", "collaboration"
-            }
-        }
+    Returns:
+        ahocorasick.Automaton: Automaton mapping each skill to itself
+    """
+    automaton = ahocorasick.Automaton()
+    for skill in skills:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+_SKILL_AUTOMATON = _build_automaton(ALL_SKILLS)
+
+# Runs of whitespace (line breaks, tabs, repeated spaces) between words
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def _normalize_text(text_lower):
+    """
+    Collapse whitespace so multi-word skills split across lines still match
+    
+    Args:
+        text_lower (str): Lowercased text
         
-        # Create a flattened set of all skills
-        self.all_skills = set()
-        for category in self.skill_categories.values():
-            self.all_skills.update(category)
-        self.all_skills.update(self.common_tech_skills)
+    Returns:
+        str: The text with every run of whitespace replaced by a single space
+    """
+    return _WHITESPACE_RE.sub(' ', text_lower)
+
+def _is_word_char(char):
+    """
+    Check whether a character is part of a word, like regex \\w
+    
+    Args:
+        char (str): A single character
+        
+    Returns:
+        bool: True for letters, digits and underscores
+    """
+    return char.isalnum() or char == '_'
+
+def _iter_skill_matches(text_lower):
+    """
+    Yield whole word skill matches in normalized lowercased text
+    
+    Args:
+        text_lower (str): Lowercased text with whitespace collapsed
         
-        # Initialize vectorizer for text similarity
-        self.vectorizer = CountVectorizer()
+    Yields:
+        tuple: (end, skill) with end the index of the last matched character
+    """
+    last = len(text_lower) - 1
+    for end, skill in _SKILL_AUTOMATON.iter(text_lower):
+        start = end - len(skill) + 1
+        # Only accept whole word matches
+        if start > 0 and _is_word_char(text_lower[start - 1]):
+            continue
+        if end < last and _is_word_char(text_lower[end + 1]):
+            continue
+        yield end, skill
+
+# Tokenizer for text similarity (same tokens as sklearn's CountVectorizer)
+_TOKEN_RE = re.compile(r'(?u)\b\w\w+\b')
+
+def calculate_similarity(resume_text, job_text):
+    """
+    Calculate the similarity between resume text and job description text
+    
+    Args:
+        resume_text (str): Lowercased text from the resume
+        job_text (str): Lowercased text from the job description
         
-    def extract_skills(self, text):
+    Returns:
+        float: Similarity score between 0 and 1
+    """
+    if not resume_text or not job_text:
+        return 0.0
+    
+    # Cosine similarity between the two bags of words
+    resume_counts = Counter(_TOKEN_RE.findall(resume_text))
+    job_counts = Counter(_TOKEN_RE.findall(job_text))
+    
+    common = resume_counts.keys() & job_counts.keys()
+    dot = sum(resume_counts[word] * job_counts[word] for word in common)
+    resume_norm = math.sqrt(sum(count * count for count in resume_counts.values()))
+    job_norm = math.sqrt(sum(count * count for count in job_counts.values()))
+    
+    if not resume_norm or not job_norm:
+        return 0.0
+    return dot / (resume_norm * job_norm)
+
+class SkillMatcher:
+    @staticmethod
+    def extract_skills(text):
         """
         Extract skills from text using pattern matching
         
@@ -82,65 +124,46 @@ class SkillMatcher:
             text (str): The text to extract skills from
             
         Returns:
-            set: A set of skills extracted from the text
+            frozenset: The skills extracted from the text
         """
         if not text:
-            return set()
-        
-        text_lower = text.lower()
-        skills = set()
-        
-        # Extract skills using pattern matching for known skills
-        for skill in self.all_skills:
-            # Use regex to find whole word matches
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                skills.add(skill)
-        
-        # Look for capitalized abbreviations that might be technologies or languages
-        abbrev_pattern = r'\b[A-Z][A-Z]+\b'
-        for match in re.finditer(abbrev_pattern, text):
-            skill_abbr = match.group().lower()
-            if len(skill_abbr) >= 2:  # Only consider abbreviations with 2+ letters
-                skills.add(skill_abbr)
-        
-        # Look for phrases that might be skills (simple noun phrases)
-        # This is a simplified approach that doesn't need spaCy
-        words = re.findall(r'\b[a-zA-Z][a-zA-Z\-\.]+\b', text_lower)
-        bigrams = [' '.join(words[i:i+2]) for i in range(len(words)-1)]
-        trigrams = [' '.join(words[i:i+3]) for i in range(len(words)-2)]
-        
-        # Check if any of these n-grams are known skills
-        for phrase in bigrams + trigrams:
-            if phrase in self.all_skills:
-                skills.add(phrase)
-        
-        return skills
-
-    def calculate_similarity(self, resume_text, job_text):
+            return frozenset()
+        
+        text_lower = _normalize_text(text.lower())
+        
+        # Match all known skills (including multi-word phrases and abbreviations
+        # such as "AWS" or "NLP") in a single pass
+        return frozenset(skill for _, skill in _iter_skill_matches(text_lower))
+
+    @staticmethod
+    def extract_skills_pair(resume_lower, job_desc_lower):
         """
-        Calculate the similarity between resume text and job description text
+        Extract skills from a resume and a job description in a single pass
         
         Args:
-            resume_text (str): Text from the resume
-            job_text (str): Text from the job description
+            resume_lower (str): Lowercased text from the resume
+            job_desc_lower (str): Lowercased text from the job description
             
         Returns:
-            float: Similarity score between 0 and 1
+            tuple: (resume skills, job description skills) as frozensets
         """
-        if not resume_text or not job_text:
-            return 0.0
-        
-        # Create a document-term matrix
-        documents = [resume_text.lower(), job_text.lower()]
-        try:
-            X = self.vectorizer.fit_transform(documents)
-            # Calculate cosine similarity
-            similarity = cosine_similarity(X)[0, 1]
-            return similarity
-        except Exception as e:
-            logger.error(f"Error calculating similarity: {str(e)}")
-            return 0.0
+        resume_lower = _normalize_text(resume_lower)
+        job_desc_lower = _normalize_text(job_desc_lower)
+        
+        # Join the documents with a sentinel that is neither a word character
+        # nor part of any skill, so no match can span the boundary
+        joined = resume_lower + '\x00' + job_desc_lower
+        boundary = len(resume_lower)
+        
+        resume_skills = set()
+        job_skills = set()
+        for end, skill in _iter_skill_matches(joined):
+            if end < boundary:
+                resume_skills.add(skill)
+            else:
+                job_skills.add(skill)
+        
+        return frozenset(resume_skills), frozenset(job_skills)
             
     def find_matching_skills(self, resume_skills, job_skills):
         """
@@ -181,16 +204,19 @@ class SkillMatcher:
         Returns:
             dict: Analysis results including match percentage and skills
         """
+        # Lowercase each document once and share it between the steps below
+        resume_lower = resume_text.lower()
+        job_desc_lower = job_desc_text.lower()
+        
         # Extract skills from both documents
-        resume_skills = self.extract_skills(resume_text)
-        job_skills = self.extract_skills(job_desc_text)
+        resume_skills, job_skills = self.extract_skills_pair(resume_lower, job_desc_lower)
         
         # Find matching and missing skills
         matching_skills = self.find_matching_skills(resume_skills, job_skills)
         missing_skills = self.find_missing_skills(resume_skills, job_skills, matching_skills)
         
         # Calculate text similarity
-        text_similarity = self.calculate_similarity(resume_text, job_desc_text)
+        text_similarity = calculate_similarity(resume_lower, job_desc_lower)
         
         # Calculate match percentage
         # We use a weighted approach: 50% based on similarity, 50% based on coverage
@@ -201,13 +227,30 @@ class SkillMatcher:
             
         match_percentage = (text_similarity * 0.5 + coverage * 0.5) * 100
         
-        # Format results
-        results = {
+        return self.format_results(match_percentage, resume_skills, job_skills,
+                                   matching_skills, missing_skills)
+
+    @staticmethod
+    def format_results(match_percentage, resume_skills, job_skills, matching_skills, missing_skills):
+        """
+        Format analysis results for the API response
+        
+        Args:
+            match_percentage (float): Overall match percentage
+            resume_skills (set): Skills extracted from the resume
+            job_skills (set): Skills required in the job description
+            matching_skills (set): Skills that match between resume and job
+            missing_skills (set): Skills missing from the resume
+            
+        Returns:
+            dict: Analysis results including match percentage and skills
+        """
+        return {
             "match_percentage": round(match_percentage, 2),
-            "resume_skills": sorted(list(resume_skills)),
-            "job_required_skills": sorted(list(job_skills)),
-            "matching_skills": sorted(list(matching_skills)),
-            "missing_skills": sorted(list(missing_skills)),
+            "resume_skills": sorted(resume_skills),
+            "job_required_skills": sorted(job_skills),
+            "matching_skills": sorted(matching_skills),
+            "missing_skills": sorted(missing_skills),
             "skill_count": {
                 "resume": len(resume_skills),
                 "job_description": len(job_skills),
@@ -215,5 +258,13 @@ class SkillMatcher:
                 "missing": len(missing_skills)
             }
         }
+
+    @classmethod
+    def empty_result(cls):
+        """
+        Build the analysis result for documents with nothing to compare
         
-        return results
\ No newline at end of file
+        Returns:
+            dict: Analysis results with zero match and no skills
+        """
+        return cls.format_results(0.0, (), (), (), ())
\ No newline at end of file
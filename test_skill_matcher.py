@@ -0,0 +1,29 @@
+"""
+Tests for the Skill Matcher Module
+"""
+import unittest
+
+from skill_matcher import SkillMatcher
+
+
+class ExtractSkillsTest(unittest.TestCase):
+    def test_multi_word_skills_split_by_whitespace(self):
+        text = "Machine\nLearning, REST  API and Power\r\nBI\tdashboards"
+        skills = SkillMatcher.extract_skills(text)
+        self.assertTrue({"machine learning", "rest api", "power bi"} <= skills)
+
+    def test_underscore_is_part_of_a_word(self):
+        self.assertNotIn("python", SkillMatcher.extract_skills("see python_scripts/"))
+        self.assertIn("python", SkillMatcher.extract_skills("python-based tools"))
+
+    def test_pair_matches_single_document_extraction(self):
+        resume = "Machine\nLearning with Python"
+        job = "REST\n\nAPI design, python_scripts, Docker"
+        resume_skills, job_skills = SkillMatcher.extract_skills_pair(resume.lower(), job.lower())
+        self.assertEqual(resume_skills, SkillMatcher.extract_skills(resume))
+        self.assertEqual(job_skills, SkillMatcher.extract_skills(job))
+        self.assertEqual(job_skills, {"rest api", "docker"})
+
+
+if __name__ == '__main__':
+    unittest.main()